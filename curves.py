@@ -2,24 +2,109 @@
 import random
 import math
 import json
+from contextlib import nullcontext
+from multiprocessing import Pool
+
+try:
+    import gmpy2
+except ImportError:  # gmpy2 is optional; fall back to pure Python.
+    gmpy2 = None
+
+try:
+    import ec_fast
+except ImportError:  # numba is optional; fall back to pure Python.
+    ec_fast = None
 
 # ---------------------
 # Helper Functions
 # ---------------------
 
+_SMALL_PRIMES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41, 43, 47, 53)
+
+# Miller-Rabin with these witnesses is deterministic for n < 3.187 * 10^23 (psi_12).
+_MR_WITNESSES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37)
+_MR_DETERMINISTIC_LIMIT = 318665857834031151167461
+
+def _miller_rabin(n, a, d, s):
+    """Strong probable-prime test of odd n to base a, where n - 1 = d * 2^s."""
+    x = pow(a, d, n)
+    if x == 1 or x == n - 1:
+        return True
+    for _ in range(s - 1):
+        x = x * x % n
+        if x == n - 1:
+            return True
+    return False
+
+def _jacobi(a, n):
+    """Jacobi symbol (a/n) for odd n > 0."""
+    a %= n
+    result = 1
+    while a:
+        while a % 2 == 0:
+            a //= 2
+            if n % 8 in (3, 5):
+                result = -result
+        a, n = n, a
+        if a % 4 == 3 and n % 4 == 3:
+            result = -result
+        a %= n
+    return result if n == 1 else 0
+
+def _strong_lucas(n):
+    """Strong Lucas probable-prime test (Selfridge parameters) for odd n."""
+    if math.isqrt(n) ** 2 == n:
+        return False
+    D = 5
+    while True:
+        j = _jacobi(D, n)
+        if j == -1:
+            break
+        if j == 0 and abs(D) != n:
+            return False
+        D = -D - 2 if D > 0 else -D + 2
+    P, Q = 1, (1 - D) // 4
+    d, s = n + 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    inv2 = (n + 1) // 2
+    # Left-to-right binary ladder for U_d, V_d, Q^d.
+    U, V, Qk = 1, P, Q % n
+    for bit in bin(d)[3:]:
+        U, V = U * V % n, (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if bit == "1":
+            U, V = (P * U + V) * inv2 % n, (D * U + P * V) * inv2 % n
+            Qk = Qk * Q % n
+    if U == 0 or V == 0:
+        return True
+    for _ in range(s - 1):
+        V = (V * V - 2 * Qk) % n
+        Qk = Qk * Qk % n
+        if V == 0:
+            return True
+    return False
+
 def is_prime(n):
-    """Trial division to test primality (suitable for small n)."""
+    """
+    Primality test: small-prime wheel, then deterministic Miller-Rabin for
+    n < 3.19e23 and Baillie-PSW beyond that.
+    """
     if n < 2:
         return False
-    if n in (2, 3):
+    for q in _SMALL_PRIMES:
+        if n % q == 0:
+            return n == q
+    if n < _SMALL_PRIMES[-1] ** 2:
         return True
-    if n % 2 == 0:
-        return False
-    r = int(math.isqrt(n))
-    for i in range(3, r + 1, 2):
-        if n % i == 0:
-            return False
-    return True
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d //= 2
+        s += 1
+    if n < _MR_DETERMINISTIC_LIMIT:
+        return all(_miller_rabin(n, a, d, s) for a in _MR_WITNESSES)
+    return _miller_rabin(n, 2, d, s) and _strong_lucas(n)
 
 def generate_candidate_prime(bit_length, max_attempts=1000000):
     """
@@ -36,23 +121,59 @@ def generate_candidate_prime(bit_length, max_attempts=1000000):
             return candidate
     return None
 
+def _sieve_base_primes(limit):
+    """Return all primes <= limit using a plain Sieve of Eratosthenes."""
+    if limit < 2:
+        return []
+    sieve = bytearray(limit + 1)
+    sieve[0] = sieve[1] = 1
+    for q in range(2, math.isqrt(limit) + 1):
+        if not sieve[q]:
+            sieve[q * q::q] = b"\x01" * len(range(q * q, limit + 1, q))
+    return [q for q, v in enumerate(sieve) if not v]
+
+# Number of integers sieved at a time by find_all_candidate_primes.
+_SIEVE_SEGMENT = 1 << 16
+
 def find_all_candidate_primes(bit_length):
     """
-    Return a list of all primes with exactly 'bit_length' bits that:
+    Yield, in increasing order, all primes with exactly 'bit_length' bits that:
       - are greater than 3,
       - are not 7 (to avoid the singular curve for y^2 = x^3 + 7),
       - and satisfy p ≡ 1 mod 3.
+    Uses a segmented Sieve of Eratosthenes over [2^(b-1), 2^b) instead of
+    trial division on every candidate. Segments are sieved lazily, so callers
+    that stop early never pay for the rest of the window.
     """
     lower = 1 << (bit_length - 1)
     upper = (1 << bit_length) - 1
-    candidates = []
-    for candidate in range(lower, upper + 1):
-        if candidate > 3 and candidate != 7 and candidate % 3 == 1 and is_prime(candidate):
-            candidates.append(candidate)
-    return candidates
+    base_primes = _sieve_base_primes(math.isqrt(upper))
+    for seg_lower in range(lower, upper + 1, _SIEVE_SEGMENT):
+        seg_upper = min(seg_lower + _SIEVE_SEGMENT - 1, upper)
+        # sieve[i] == 1 marks seg_lower + i as composite (or < 2).
+        sieve = bytearray(seg_upper - seg_lower + 1)
+        for i in range(max(0, 2 - seg_lower)):
+            sieve[i] = 1
+        for q in base_primes:
+            start = max(q * q, (seg_lower + q - 1) // q * q)
+            if start > seg_upper:
+                continue
+            sieve[start - seg_lower::q] = b"\x01" * len(range(start, seg_upper + 1, q))
+        for i, v in enumerate(sieve):
+            candidate = seg_lower + i
+            if not v and candidate > 3 and candidate != 7 and candidate % 3 == 1:
+                yield candidate
+
+# Above this size gmpy2's mpz beats CPython ints at mulmod/powmod.
+_GMP_MIN_BITS = 64
+
+def _use_gmp(p):
+    return gmpy2 is not None and p.bit_length() > _GMP_MIN_BITS
 
 def mod_inv(a, p):
     """Modular inverse of a modulo p (p assumed prime)."""
+    if _use_gmp(p):
+        return int(gmpy2.invert(a % p, p))
     return pow(a, -1, p)
 
 def point_add(P, Q, p):
@@ -78,28 +199,202 @@ def point_add(P, Q, p):
     y_r = (s * (P[0] - x_r) - P[1]) % p
     return (x_r, y_r)
 
-def scalar_mult(k, P, p):
-    """Compute k * P by double-and-add; P is a point on the curve over F_p."""
-    R = None  # The identity element
-    Q = P
+def _precompute_odd_multiples(P, w, p):
+    """Return [P, 3P, 5P, ..., (2^(w-1) - 1)P] for width-w NAF."""
+    table = [P]
+    P2 = point_add(P, P, p)
+    for _ in range((1 << (w - 2)) - 1):
+        table.append(point_add(table[-1], P2, p))
+    return table
+
+def _wnaf(k, w):
+    """Width-w non-adjacent form of k > 0, least significant digit first."""
+    digits = []
+    window = 1 << w
     while k > 0:
         if k & 1:
-            R = point_add(R, Q, p)
-        Q = point_add(Q, Q, p)
-        k //= 2
-    return R
+            z = k % window
+            if z >= window >> 1:
+                z -= window
+            k -= z
+        else:
+            z = 0
+        digits.append(z)
+        k >>= 1
+    return digits
+
+# Jacobian coordinates: (X, Y, Z) represents the affine point (X/Z^2, Y/Z^3);
+# Z == 0 is the point at infinity. These avoid a modular inverse per step.
+_JAC_INFINITY = (1, 1, 0)
+
+def _to_jacobian(P):
+    if P is None:
+        return _JAC_INFINITY
+    return (P[0], P[1], 1)
+
+def _from_jacobian(X, Y, Z, p):
+    if Z % p == 0:
+        return None
+    z_inv = mod_inv(Z, p)
+    z_inv2 = z_inv * z_inv % p
+    return (int(X * z_inv2 % p), int(Y * z_inv2 * z_inv % p))
+
+def _jac_double(X, Y, Z, p):
+    """Double a Jacobian point on a curve with a = 0 (dbl-2009-l)."""
+    if Z == 0 or Y == 0:
+        return _JAC_INFINITY
+    A = X * X % p
+    B = Y * Y % p
+    C = B * B % p
+    D = 2 * ((X + B) * (X + B) - A - C) % p
+    E = 3 * A % p
+    F = E * E % p
+    X3 = (F - 2 * D) % p
+    Y3 = (E * (D - X3) - 8 * C) % p
+    Z3 = 2 * Y * Z % p
+    return (X3, Y3, Z3)
+
+def _jac_add(X1, Y1, Z1, X2, Y2, Z2, p):
+    """Add two Jacobian points (add-2007-bl)."""
+    if Z1 == 0:
+        return (X2, Y2, Z2)
+    if Z2 == 0:
+        return (X1, Y1, Z1)
+    Z1Z1 = Z1 * Z1 % p
+    Z2Z2 = Z2 * Z2 % p
+    U1 = X1 * Z2Z2 % p
+    U2 = X2 * Z1Z1 % p
+    S1 = Y1 * Z2 * Z2Z2 % p
+    S2 = Y2 * Z1 * Z1Z1 % p
+    H = (U2 - U1) % p
+    if H == 0:
+        if S1 == S2:
+            return _jac_double(X1, Y1, Z1, p)
+        return _JAC_INFINITY
+    I = 4 * H * H % p
+    J = H * I % p
+    r = 2 * (S2 - S1) % p
+    V = U1 * I % p
+    X3 = (r * r - J - 2 * V) % p
+    Y3 = (r * (V - X3) - 2 * S1 * J) % p
+    Z3 = ((Z1 + Z2) * (Z1 + Z2) - Z1Z1 - Z2Z2) * H % p
+    return (X3, Y3, Z3)
+
+def _use_fast(k, p):
+    """True when k * P over F_p can run in the numba ladder (p and k fit in int64)."""
+    return (ec_fast is not None and p.bit_length() <= ec_fast.MAX_BITS
+            and k.bit_length() <= ec_fast.MAX_SCALAR_BITS)
+
+def _scalar_mult_fast(k, P, p):
+    """Compute k * P (k > 0) with the numba ladder in ec_fast; see _use_fast."""
+    x, y, at_infinity = ec_fast.scalar_mult_u64(k, P[0], P[1], p, k.bit_length())
+    if at_infinity:
+        return None
+    return (int(x), int(y))
+
+def _odd_multiples_table(P, w, p):
+    return [_to_jacobian(T) for T in _precompute_odd_multiples(P, w, p)]
+
+def precompute_window(P, p, w=4):
+    """
+    Precompute the width-w NAF table {P, 3P, 5P, ...} for a base point P so
+    several multiplications of P can share it via scalar_mult_fixed_base.
+    """
+    if P is None or (ec_fast is not None and p.bit_length() <= ec_fast.MAX_BITS):
+        # The numba ladder needs no table; it is built on demand for huge scalars.
+        return (w, P, None)
+    if _use_gmp(p):
+        p = gmpy2.mpz(p)
+    return (w, P, _odd_multiples_table(P, w, p))
+
+def scalar_mult_fixed_base(k, tbl, p):
+    """
+    Compute k * P using width-w NAF with a table from precompute_window(P, p, w).
+    The accumulator is kept in Jacobian coordinates and converted back to
+    affine once at the end.
+    """
+    w, P, table = tbl
+    if k <= 0 or P is None:
+        return None
+    if _use_fast(k, p):
+        return _scalar_mult_fast(k, P, p)
+    if _use_gmp(p):
+        p = gmpy2.mpz(p)
+    if table is None:
+        table = _odd_multiples_table(P, w, p)
+    R = _JAC_INFINITY
+    for z in reversed(_wnaf(k, w)):
+        R = _jac_double(*R, p)
+        if z > 0:
+            R = _jac_add(*R, *table[z >> 1], p)
+        elif z < 0:
+            X, Y, Z = table[-z >> 1]
+            R = _jac_add(*R, X, -Y % p, Z, p)
+    return _from_jacobian(*R, p)
+
+def scalar_mult(k, P, p, w=4):
+    """Compute k * P using width-w NAF; P is a point on the curve over F_p."""
+    if k <= 0 or P is None:
+        return None
+    return scalar_mult_fixed_base(k, precompute_window(P, p, w), p)
+
+def _cswap(swap, A, B):
+    """Swap Jacobian points A and B when swap == 1, using masked arithmetic."""
+    mask = -swap
+    A_out, B_out = [], []
+    for a, b in zip(A, B):
+        t = mask & (a ^ b)
+        A_out.append(a ^ t)
+        B_out.append(b ^ t)
+    return tuple(A_out), tuple(B_out)
+
+def scalar_mult_ct(k, P, p, n):
+    """
+    Compute k * P for a point P of order n (0 <= k < n) with a Montgomery ladder.
+    k is first replaced by k + n or k + 2n so that it always has exactly
+    n.bit_length() + 1 bits; the ladder then starts from (P, 2P) and does one
+    addition and one doubling per remaining bit, with the key bit selecting a
+    masked swap instead of a branch. The bit length of k therefore does not
+    show in the operation count. This is not strictly constant time: an
+    intermediate multiple that hits the point at infinity still takes the
+    early-return path in _jac_add/_jac_double, and Python big-int arithmetic
+    is not constant time either.
+    """
+    if P is None:
+        return None
+    L = n.bit_length()
+    k = k % n + n
+    if k.bit_length() <= L:
+        k += n
+    if _use_fast(k, p):
+        return _scalar_mult_fast(k, P, p)
+    if _use_gmp(p):
+        p = gmpy2.mpz(p)
+    R0 = _to_jacobian(P)
+    R1 = _jac_double(*R0, p)
+    prev = 0
+    for i in range(L - 1, -1, -1):
+        b = (k >> i) & 1
+        R0, R1 = _cswap(b ^ prev, R0, R1)
+        R1 = _jac_add(*R0, *R1, p)
+        R0 = _jac_double(*R0, p)
+        prev = b
+    R0, R1 = _cswap(prev, R0, R1)
+    return _from_jacobian(*R0, p)
 
 def tonelli_shanks(n, p):
     """
     Solve for a square root of n modulo p (if one exists) using the Tonelli-Shanks algorithm.
     Returns one square root; the other is p - result.
     """
+    if _use_gmp(p):
+        n, p = gmpy2.mpz(n), gmpy2.mpz(p)
     # Check existence using Euler's criterion.
     if pow(n, (p - 1) // 2, p) != 1:
         return None
     # Shortcut when p ≡ 3 mod 4.
     if p % 4 == 3:
-        return pow(n, (p + 1) // 4, p)
+        return int(pow(n, (p + 1) // 4, p))
     # Write p - 1 as Q * 2^S with Q odd.
     Q = p - 1
     S = 0
@@ -127,14 +422,22 @@ def tonelli_shanks(n, p):
         c = (b * b) % p
         R = (R * b) % p
         t = (t * c) % p
-    return R
+    return int(R)
 
 def count_points(p):
     """
     Deterministically count the points on the curve y^2 = x^3 + 7 over F_p.
     (Counts the point at infinity as well.)
+    Uses gmpy2's Jacobi symbol for the quadratic-residue test when available.
     WARNING: This method loops over all x in F_p (O(p)) and may be very slow for large p.
     """
+    if gmpy2 is not None:
+        legendre = gmpy2.legendre
+        mp = gmpy2.mpz(p)
+        # Each x contributes 1 + legendre(rhs): 1 point if rhs == 0, 2 if a residue, 0 otherwise.
+        return 1 + p + sum(legendre((x * x * x + 7) % p, mp) for x in range(p))
+
+    euler_exp = (p - 1) // 2
     count = 1  # Start with the point at infinity.
     for x in range(p):
         rhs = (x * x * x + 7) % p
@@ -142,41 +445,137 @@ def count_points(p):
             count += 1  # Only solution y = 0.
         else:
             # Use Euler's criterion to test if rhs is a quadratic residue.
-            if pow(rhs, (p - 1) // 2, p) == 1:
+            if pow(rhs, euler_exp, p) == 1:
                 count += 2  # Two solutions: y and p - y.
     return count
 
+def cornacchia(d, p):
+    """
+    Solve x^2 + d*y^2 = p for a prime p using Cornacchia's algorithm.
+    Returns (x, y) or None if no solution exists.
+    """
+    r = tonelli_shanks(-d % p, p)
+    if r is None:
+        return None
+    if 2 * r < p:
+        r = p - r
+    a, b = p, r
+    bound = math.isqrt(p)
+    while b > bound:
+        a, b = b, a % b
+    rem = p - b * b
+    if rem % d:
+        return None
+    c = math.isqrt(rem // d)
+    if c * c != rem // d:
+        return None
+    return (b, c)
+
+def count_points_cm(p, max_rounds=20):
+    """
+    Count the points on y^2 = x^3 + 7 over F_p (p ≡ 1 mod 3) via complex multiplication.
+    The curve has CM by Z[w], so writing p = a^2 + 3b^2 leaves only six possible
+    traces t in {±2a, ±(a + 3b), ±(a - 3b)}. Candidates #E = p + 1 - t are
+    eliminated by checking #E * P == O for random points P.
+    Falls back to count_points(p) if the candidates cannot be separated.
+    """
+    ab = cornacchia(3, p) if p % 3 == 1 else None
+    if ab is None:
+        return count_points(p)
+    a, b = ab
+    traces = {2 * a, -2 * a, a + 3 * b, -(a + 3 * b), a - 3 * b, -(a - 3 * b)}
+    candidates = sorted(p + 1 - t for t in traces)
+    # Use a private RNG so the global random stream (and the seeded results) is untouched.
+    rng = random.Random(p)
+    for _ in range(max_rounds):
+        P_table = precompute_window(pick_random_point(p, rng), p)
+        candidates = [N for N in candidates if scalar_mult_fixed_base(N, P_table, p) is None]
+        if len(candidates) == 1:
+            return candidates[0]
+    return count_points(p)
+
+def pollard_rho_brent(n):
+    """
+    Return a non-trivial factor of the composite n using Pollard's rho with
+    Brent's cycle detection (f(x) = x^2 + c mod n).
+    """
+    if n % 2 == 0:
+        return 2
+    # Deterministic parameter choices keep the global random stream untouched.
+    for c in range(1, n):
+        y, r, q, m = 2, 1, 1, 128
+        g = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                ys = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = math.gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # Batched gcd overshot; step back one iteration at a time.
+            g = 1
+            while g == 1:
+                ys = (ys * ys + c) % n
+                g = math.gcd(abs(x - ys), n)
+        if g != n:
+            return g
+    return n
+
 def factorize(n):
-    """Return a dictionary of prime factors of n with their exponents (trial division)."""
+    """Return a dictionary of prime factors of n with their exponents (Pollard's rho)."""
     factors = {}
-    d = 2
-    while d * d <= n:
-        while n % d == 0:
-            factors[d] = factors.get(d, 0) + 1
-            n //= d
-        d += 1 if d == 2 else 2
-    if n > 1:
-        factors[n] = 1
-    return factors
-
-def pick_random_point(p):
+    if n < 2:
+        return factors
+    # Strip small factors cheaply before falling back to rho.
+    for q in _SMALL_PRIMES:
+        while n % q == 0:
+            factors[q] = factors.get(q, 0) + 1
+            n //= q
+    stack = [n] if n > 1 else []
+    while stack:
+        m = stack.pop()
+        if is_prime(m):
+            factors[m] = factors.get(m, 0) + 1
+            continue
+        d = pollard_rho_brent(m)
+        if d in (1, m):
+            raise RuntimeError(f"Pollard's rho failed to split {m}.")
+        stack.extend((d, m // d))
+    return dict(sorted(factors.items()))
+
+def pick_random_point(p, rng=random):
     """
     Randomly pick a point on the curve y^2 = x^3 + 7 over F_p.
-    Returns a tuple (x, y).
+    Returns a tuple (x, y). 'rng' defaults to the global random module.
     """
+    euler_exp = (p - 1) // 2
+    # When p ≡ 3 mod 4 the square root is a single exponentiation.
+    sqrt_exp = (p + 1) // 4 if p % 4 == 3 else None
     while True:
-        x = random.randint(0, p - 1)
+        x = rng.randint(0, p - 1)
         rhs = (x * x * x + 7) % p
         if rhs == 0:
             # y = 0 is the only solution.
             return (x, 0)
         # Check if rhs is a quadratic residue.
-        if pow(rhs, (p - 1) // 2, p) == 1:
-            y = tonelli_shanks(rhs, p)
-            if y is None:
-                continue
+        if pow(rhs, euler_exp, p) == 1:
+            if sqrt_exp is not None:
+                y = pow(rhs, sqrt_exp, p)
+                if y * y % p != rhs:
+                    continue
+            else:
+                y = tonelli_shanks(rhs, p)
+                if y is None:
+                    continue
             # Randomly choose one of the two square roots.
-            if random.choice([True, False]):
+            if rng.choice([True, False]):
                 y = p - y
             return (x, y)
 
@@ -201,10 +600,7 @@ def random_checking(upper_bound):
             print(f"No suitable prime found for bit size {bit_length}.")
             continue
 
-        # WARNING: Point counting using a loop over F_p is O(p) and may be very slow for large p.
-        if p > 10000:
-            print("p is large; point counting may be slow. (This may take a while...)")
-        order = count_points(p)
+        order = count_points_cm(p)
 
         # Factorize the order to find its prime factors.
         factors = factorize(order)
@@ -233,7 +629,7 @@ def random_checking(upper_bound):
         # Choose a random private key d in [1, n - 1].
         d = random.randint(1, n - 1)
         # Compute the public key Q = d * G.
-        Q = scalar_mult(d, G, p)
+        Q = scalar_mult_ct(d, G, p, n)
 
         successful_runs += 1
 
@@ -249,119 +645,145 @@ def random_checking(upper_bound):
     print(f"Seed: {seed}")
     print(f"Total successful runs: {successful_runs}")
 
-def strict_check(upper_bound):
-    # Fix the seed for reproducibility.
-    seed = 536
-    random.seed(seed)
+def _process_bit(bit_length, rng=random):
+    """
+    Search the candidate primes of one bit length for a valid curve.
+    Progress is printed as it happens; returns (text, record) where 'text' is
+    this bit length's section of the output file and 'record' is the JSON
+    record of the successful curve (None if no curve was found).
+    """
+    lines = []
+    header = f"\n--- Bit size {bit_length} ---\n"
+    print(header)
+    lines.append(header)
+
+    # Try each candidate systematically until one yields a valid curve.
+    # Candidates are generated lazily, so stopping early skips the rest of the sieve.
+    any_candidates = False
+    for p in find_all_candidate_primes(bit_length):
+        any_candidates = True
+        msg = f"\nTrying candidate prime: {p}\n"
+        print(msg, end="")
+
+        order = count_points_cm(p)
+        factors = factorize(order)
+        n = max(factors.keys())  # Largest prime factor as subgroup order.
+        h = order // n
+        msg = f"Candidate {p}: Curve order = {order}, Subgroup order n = {n}, Cofactor h = {h}\n"
+        print(msg, end="")
 
-    # Open the output file.
-    output_filename = "successful_curves.txt"
-    output_json = "successful_curves.json"
-    results = []
-    with open(output_filename, "w") as f_out:
-        f_out.write("Q Day Curves\n")
-        f_out.write(f"Seed for reproducibility: {seed}\n")
-        f_out.write("=" * 40 + "\n\n")
+        # Ensure the subgroup is "large" (i.e. h is small).
+        if h > 2:
+            msg = f"Skipping candidate {p}: subgroup cofactor too large (h = {h}).\n"
+            print(msg, end="")
+            continue
 
-        successful_runs = 0
-        for bit_length in range(1, upper_bound):
-            header = f"\n--- Bit size {bit_length} ---\n"
-            print(header)
-            f_out.write(header)
-
-            # Get the full list of candidate primes for this bit length.
-            candidate_primes = find_all_candidate_primes(bit_length)
-            if not candidate_primes:
-                msg = f"No candidate primes found for bit size {bit_length}.\n"
-                print(msg)
-                f_out.write(msg)
-                continue
+        # Pick a random point on the curve.
+        P = pick_random_point(p, rng)
+        # Project P into the subgroup by multiplying by the cofactor.
+        G = scalar_mult(h, P, p)
+        if G is None:
+            msg = f"Candidate {p} failed to generate a non-identity subgroup point.\n"
+            print(msg, end="")
+            continue
 
-            # Try each candidate systematically until one yields a valid curve.
-            found = False
-            for p in candidate_primes:
-                msg = f"\nTrying candidate prime: {p}\n"
-                print(msg, end="")
-
-                if p > 10000:
-                    msg = "p is large; point counting may be slow. (This may take a while...)\n"
-                    print(msg, end="")
-                order = count_points(p)
-                factors = factorize(order)
-                n = max(factors.keys())  # Largest prime factor as subgroup order.
-                h = order // n
-                msg = f"Candidate {p}: Curve order = {order}, Subgroup order n = {n}, Cofactor h = {h}\n"
-                print(msg, end="")
-
-                # Ensure the subgroup is "large" (i.e. h is small).
-                if h > 2:
-                    msg = f"Skipping candidate {p}: subgroup cofactor too large (h = {h}).\n"
-                    print(msg, end="")
-                    continue
+        # Verify that the order of G is exactly n.
+        if scalar_mult(n, G, p) is not None:
+            msg = f"Candidate {p} generated a G with incorrect order. Skipping.\n"
+            print(msg, end="")
+            continue
 
-                # Pick a random point on the curve.
-                P = pick_random_point(p)
-                # Project P into the subgroup by multiplying by the cofactor.
-                G = scalar_mult(h, P, p)
-                if G is None:
-                    msg = f"Candidate {p} failed to generate a non-identity subgroup point.\n"
-                    print(msg, end="")
-                    continue
+        # Generate key pair:
+        d = rng.randint(1, n - 1)
+        Q = scalar_mult_ct(d, G, p, n)
 
-                # Verify that the order of G is exactly n.
-                if scalar_mult(n, G, p) is not None:
-                    msg = f"Candidate {p} generated a G with incorrect order. Skipping.\n"
-                    print(msg, end="")
-                    continue
+        if Q is None:
+            msg = f"Candidate {p} failed to generate a valid public key.\n"
+            print(msg, end="")
+            continue
 
-                # Generate key pair:
-                d = random.randint(1, n - 1)
-                Q = scalar_mult(d, G, p)
+        # This candidate is successful.
+        success_msg = f"Candidate {p} successful!\n"
+        print(success_msg, end="")
+        lines.append(f"Bit size: {bit_length}\n")
+        lines.append(f"Prime p: {p}\n")
+        lines.append(f"Curve order (#E): {order}\n")
+        lines.append(f"Subgroup order n: {n}\n")
+        lines.append(f"Cofactor h: {h}\n")
+        lines.append(f"Generator point G: {G}\n")
+        lines.append(f"Private key d: {d}\n")
+        lines.append(f"Public key Q: {Q}\n")
+
+        record = {
+            "bit_length": bit_length,
+            "prime": p,
+            "curve_order": order,
+            "subgroup_order": n,
+            "cofactor": h,
+            "generator_point": G,
+            "private_key": d,
+            "public_key": Q,
+        }
+        # Stop after the first valid candidate per bit size.
+        return "".join(lines), record
+
+    if not any_candidates:
+        msg = f"No candidate primes found for bit size {bit_length}.\n"
+        print(msg)
+    else:
+        msg = f"No valid curve found for bit size {bit_length}.\n"
+        print(msg, end="")
+    lines.append(msg)
+    return "".join(lines), None
 
-                if Q is None:
-                    msg = f"Candidate {p} failed to generate a valid public key.\n"
-                    print(msg, end="")
-                    continue
+def _process_bit_seeded(args):
+    """Pool worker: run _process_bit with its own RNG seeded from (seed, bit_length)."""
+    bit_length, seed = args
+    return _process_bit(bit_length, random.Random(seed ^ bit_length))
 
-                # This candidate is successful.
-                success_msg = f"Candidate {p} successful!\n"
-                print(success_msg, end="")
-                f_out.write(f"Bit size: {bit_length}\n")
-                f_out.write(f"Prime p: {p}\n")
-                f_out.write(f"Curve order (#E): {order}\n")
-                f_out.write(f"Subgroup order n: {n}\n")
-                f_out.write(f"Cofactor h: {h}\n")
-                f_out.write(f"Generator point G: {G}\n")
-                f_out.write(f"Private key d: {d}\n")
-                f_out.write(f"Public key Q: {Q}\n")
-
-                results.append({
-                    "bit_length": bit_length,
-                    "prime": p,
-                    "curve_order": order,
-                    "subgroup_order": n,
-                    "cofactor": h,
-                    "generator_point": list(G),
-                    "private_key": d,
-                    "public_key": list(Q),
-                })
+def strict_check(upper_bound, parallel=False):
+    """
+    Find one valid curve for every bit length in [1, upper_bound).
+
+    Successful curves are streamed to successful_curves.jsonl, one JSON record
+    per line. By default bit lengths are processed in order from one seeded
+    random stream, which reproduces curves.json. With parallel=True they are
+    spread over a multiprocessing.Pool and each bit length gets its own RNG
+    seeded with seed ^ bit_length; results are reproducible but differ from
+    the sequential run.
+    """
+    # Fix the seed for reproducibility.
+    seed = 536
+    random.seed(seed)
 
-                successful_runs += 1
-                found = True
-                # Optionally break after the first valid candidate per bit size.
-                break
+    # Open the output files; JSON records are streamed one per line as they land.
+    output_filename = "successful_curves.txt"
+    output_json = "successful_curves.jsonl"
+    successful_runs = 0
+    with Pool() if parallel else nullcontext() as pool, \
+            open(output_filename, "w") as f_out, open(output_json, "w") as jf:
+        f_out.write("Q Day Curves\n")
+        f_out.write(f"Seed for reproducibility: {seed}\n")
+        f_out.write("=" * 40 + "\n\n")
 
-            if not found:
-                msg = f"No valid curve found for bit size {bit_length}.\n"
-                print(msg, end="")
-                f_out.write(msg)
+        if parallel:
+            # imap (rather than imap_unordered) keeps the output in bit-length order.
+            outcomes = pool.imap(
+                _process_bit_seeded,
+                [(bit_length, seed) for bit_length in range(1, upper_bound)],
+            )
+        else:
+            outcomes = map(_process_bit, range(1, upper_bound))
 
-    # Write out the JSON file
-    with open(output_json, "w") as jf:
-        json.dump(results, jf, indent=2)
+        for text, record in outcomes:
+            f_out.write(text)
+            if record is not None:
+                jf.write(json.dumps(record) + "\n")
+                jf.flush()
+                successful_runs += 1
 
-        print("\nAll done!")
-        print(f"Total successful runs: {successful_runs}")
+    print("\nAll done!")
+    print(f"Total successful runs: {successful_runs}")
 
 if __name__ == "__main__":
     # random_checking(22)
@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Numba-compiled field and point arithmetic for y^2 = x^3 + 7 over small primes.
+
+All values are kept reduced in [0, p) and every product is reduced straight
+away, so int64 never overflows as long as p < 2^MAX_BITS. curves.py dispatches
+here for such primes and uses Python big ints otherwise.
+"""
+from numba import njit
+
+# (p - 1)^2 must fit in a signed 64-bit integer.
+MAX_BITS = 31
+# Scalars are passed to the ladder as int64.
+MAX_SCALAR_BITS = 62
+
+
+@njit(cache=True)
+def modinv_u64(a, p):
+    """
+    Modular inverse of a modulo the odd prime p by binary extended GCD.
+    The subtract step selects its operands with masks instead of branching.
+    Returns 0 when a ≡ 0 mod p.
+    """
+    u = a % p
+    if u == 0:
+        return 0
+    v = p
+    x1 = 1
+    x2 = 0
+    while u != 1 and v != 1:
+        while (u & 1) == 0:
+            u >>= 1
+            x1 = (x1 + (p & -(x1 & 1))) >> 1
+        while (v & 1) == 0:
+            v >>= 1
+            x2 = (x2 + (p & -(x2 & 1))) >> 1
+        # m = -1 if u >= v else 0
+        m = -int(u >= v)
+        du = v & m
+        dv = u & ~m
+        u -= du
+        v -= dv
+        dx1 = x2 & m
+        dx2 = x1 & ~m
+        x1 -= dx1
+        x2 -= dx2
+    if u == 1:
+        return x1 % p
+    return x2 % p
+
+
+@njit(cache=True)
+def jac_double(X, Y, Z, p):
+    """Double a Jacobian point on a curve with a = 0 (dbl-2009-l)."""
+    if Z == 0 or Y == 0:
+        return 1, 1, 0
+    A = X * X % p
+    B = Y * Y % p
+    C = B * B % p
+    T = (X + B) % p
+    D = 2 * ((T * T - A - C) % p) % p
+    E = 3 * A % p
+    F = E * E % p
+    X3 = (F - 2 * D) % p
+    Y3 = (E * ((D - X3) % p) - 8 * C) % p
+    Z3 = 2 * (Y * Z % p) % p
+    return X3, Y3, Z3
+
+
+@njit(cache=True)
+def jac_add(X1, Y1, Z1, X2, Y2, Z2, p):
+    """Add two Jacobian points (add-2007-bl)."""
+    if Z1 == 0:
+        return X2, Y2, Z2
+    if Z2 == 0:
+        return X1, Y1, Z1
+    Z1Z1 = Z1 * Z1 % p
+    Z2Z2 = Z2 * Z2 % p
+    U1 = X1 * Z2Z2 % p
+    U2 = X2 * Z1Z1 % p
+    S1 = Y1 * (Z2 * Z2Z2 % p) % p
+    S2 = Y2 * (Z1 * Z1Z1 % p) % p
+    H = (U2 - U1) % p
+    if H == 0:
+        if S1 == S2:
+            return jac_double(X1, Y1, Z1, p)
+        return 1, 1, 0
+    I = 4 * (H * H % p) % p
+    J = H * I % p
+    r = 2 * ((S2 - S1) % p) % p
+    V = U1 * I % p
+    X3 = (r * r - J - 2 * V) % p
+    Y3 = (r * ((V - X3) % p) - 2 * (S1 * J % p)) % p
+    T = (Z1 + Z2) % p
+    Z3 = ((T * T - Z1Z1 - Z2Z2) % p) * H % p
+    return X3, Y3, Z3
+
+
+@njit(cache=True)
+def scalar_mult_u64(k, Px, Py, p, bits):
+    """
+    Montgomery ladder computing k * (Px, Py), where k has exactly 'bits' bits.
+    The ladder starts from (P, 2P) below the top bit, so every remaining bit
+    costs one addition and one doubling.
+    Returns (x, y, is_infinity) in affine coordinates.
+    """
+    X0, Y0, Z0 = Px, Py, 1
+    X1, Y1, Z1 = jac_double(Px, Py, 1, p)
+    prev = 0
+    for i in range(bits - 2, -1, -1):
+        b = (k >> i) & 1
+        mask = -(b ^ prev)
+        t = mask & (X0 ^ X1)
+        X0 ^= t
+        X1 ^= t
+        t = mask & (Y0 ^ Y1)
+        Y0 ^= t
+        Y1 ^= t
+        t = mask & (Z0 ^ Z1)
+        Z0 ^= t
+        Z1 ^= t
+        X1, Y1, Z1 = jac_add(X0, Y0, Z0, X1, Y1, Z1, p)
+        X0, Y0, Z0 = jac_double(X0, Y0, Z0, p)
+        prev = b
+    if prev:
+        X0, Y0, Z0 = X1, Y1, Z1
+    if Z0 == 0:
+        return 0, 0, True
+    z_inv = modinv_u64(Z0, p)
+    z_inv2 = z_inv * z_inv % p
+    return X0 * z_inv2 % p, Y0 * (z_inv2 * z_inv % p) % p, False